@@ -4,7 +4,8 @@ requests in Scrapy.
 
 See documentation in docs/topics/request-response.rst
 """
-import inspect
+import sys
+from functools import lru_cache
 from typing import (
     Any,
     AnyStr,
@@ -22,18 +23,20 @@ from typing import (
     cast,
 )
 
-from w3lib.url import safe_url_string
-
 import scrapy
 from scrapy.http.common import obsolete_setter
 from scrapy.http.headers import Headers
-from scrapy.utils.curl import curl_to_request_kwargs
 from scrapy.utils.python import to_bytes
 from scrapy.utils.trackref import object_ref
-from scrapy.utils.url import escape_ajax
+from scrapy.utils.url import _normalize_and_validate
 
 RequestTypeVar = TypeVar("RequestTypeVar", bound="Request")
 
+# HTTP methods that can be used as given, without normalization
+_COMMON_METHODS = frozenset(
+    ("GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH")
+)
+
 
 def NO_CALLBACK(*args: Any, **kwargs: Any) -> NoReturn:
     """When assigned to the ``callback`` parameter of
@@ -64,6 +67,26 @@ class Request(object_ref):
     executed by the Downloader, thus generating a :class:`Response`.
     """
 
+    # Crawls can keep millions of requests alive, so avoid a per-instance
+    # __dict__. Subclasses that do not define __slots__ get a __dict__ back,
+    # and can set arbitrary attributes as usual.
+    __slots__ = (
+        "_encoding",
+        "method",
+        "_url",
+        "_body",
+        "priority",
+        "callback",
+        "errback",
+        "_cookies",
+        "headers",
+        "dont_filter",
+        "_meta",
+        "_cb_kwargs",
+        "_flags",
+        "__weakref__",
+    )
+
     attributes: Tuple[str, ...] = (
         "url",
         "callback",
@@ -103,32 +126,70 @@ class Request(object_ref):
         flags: Optional[List[str]] = None,
         cb_kwargs: Optional[Dict[str, Any]] = None,
     ) -> None:
-        self._encoding: str = encoding  # this one has to be set first
-        self.method: str = str(method).upper()
+        # encoding and method are interned, as queued requests share a few
+        # distinct values; encoding has to be set first
+        self._encoding: str = (
+            sys.intern(encoding)
+            if type(encoding) is str  # pylint: disable=unidiomatic-typecheck
+            else encoding
+        )
+        self.method: str = (
+            method
+            if type(method) is str  # pylint: disable=unidiomatic-typecheck
+            and method in _COMMON_METHODS
+            else sys.intern(str(method).upper())
+        )
         self._set_url(url)
         self._set_body(body)
-        if not isinstance(priority, int):
+        # exact type check first, isinstance() is only needed for subclasses
+        # pylint: disable-next=unidiomatic-typecheck
+        if type(priority) is not int and not isinstance(priority, int):
             raise TypeError(f"Request priority not an integer: {priority!r}")
         self.priority: int = priority
 
-        if not (callable(callback) or callback is None):
+        if not (callback is None or callable(callback)):
             raise TypeError(
                 f"callback must be a callable, got {type(callback).__name__}"
             )
-        if not (callable(errback) or errback is None):
+        if not (errback is None or callable(errback)):
             raise TypeError(f"errback must be a callable, got {type(errback).__name__}")
         self.callback: Optional[Callable] = callback
         self.errback: Optional[Callable] = errback
 
-        self.cookies: Union[dict, List[dict]] = cookies or {}
+        self._cookies: Optional[Union[dict, List[dict]]] = cookies or None
         self.headers: Headers = Headers(headers or {}, encoding=encoding)
         self.dont_filter: bool = dont_filter
 
-        self._meta: Optional[Dict[str, Any]] = dict(meta) if meta else None
-        self._cb_kwargs: Optional[Dict[str, Any]] = (
-            dict(cb_kwargs) if cb_kwargs else None
-        )
-        self.flags: List[str] = [] if flags is None else list(flags)
+        # copy() clones dicts and lists faster than dict() and list(), but it
+        # would keep the type of their subclasses
+        if not meta:
+            self._meta: Optional[Dict[str, Any]] = None
+        elif type(meta) is dict:  # pylint: disable=unidiomatic-typecheck
+            self._meta = meta.copy()
+        else:
+            self._meta = dict(meta)
+        if not cb_kwargs:
+            self._cb_kwargs: Optional[Dict[str, Any]] = None
+        elif type(cb_kwargs) is dict:  # pylint: disable=unidiomatic-typecheck
+            self._cb_kwargs = cb_kwargs.copy()
+        else:
+            self._cb_kwargs = dict(cb_kwargs)
+        if not flags:
+            self._flags: Optional[List[str]] = None
+        elif type(flags) is list:  # pylint: disable=unidiomatic-typecheck
+            self._flags = flags.copy()
+        else:
+            self._flags = list(flags)
+
+    @property
+    def cookies(self) -> Union[dict, List[dict]]:
+        if self._cookies is None:
+            self._cookies = {}
+        return self._cookies
+
+    @cookies.setter
+    def cookies(self, value: Union[dict, List[dict]]) -> None:
+        self._cookies = value
 
     @property
     def cb_kwargs(self) -> Dict[str, Any]:
@@ -142,21 +203,30 @@ class Request(object_ref):
             self._meta = {}
         return self._meta
 
+    @property
+    def flags(self) -> List[str]:
+        if self._flags is None:
+            self._flags = []
+        return self._flags
+
+    @flags.setter
+    def flags(self, value: List[str]) -> None:
+        self._flags = value
+
     def _get_url(self) -> str:
         return self._url
 
     def _set_url(self, url: str) -> None:
-        if not isinstance(url, str):
+        # pylint: disable-next=unidiomatic-typecheck
+        if type(url) is not str and not isinstance(url, str):
             raise TypeError(f"Request url must be str, got {type(url).__name__}")
 
-        s = safe_url_string(url, self.encoding)
-        self._url = escape_ajax(s)
-
-        if (
-            "://" not in self._url
-            and not self._url.startswith("about:")
-            and not self._url.startswith("data:")
-        ):
+        if len(url) > _MAX_CACHED_URL_LENGTH or url.startswith("data:"):
+            safe_url, has_scheme = _normalize_and_validate(url, self.encoding)
+        else:
+            safe_url, has_scheme = _cached_normalize_url(url, self.encoding)
+        self._url: str = safe_url
+        if not has_scheme:
             raise ValueError(f"Missing scheme in request url: {self._url}")
 
     url = property(_get_url, obsolete_setter(_set_url, "url"))
@@ -165,7 +235,12 @@ class Request(object_ref):
         return self._body
 
     def _set_body(self, body: Optional[Union[str, bytes]]) -> None:
-        self._body = b"" if body is None else to_bytes(body, self.encoding)
+        if body is None:
+            self._body = b""
+        elif type(body) is bytes:  # pylint: disable=unidiomatic-typecheck
+            self._body = body
+        else:
+            self._body = to_bytes(body, self._encoding)
 
     body = property(_get_body, obsolete_setter(_set_body, "body"))
 
@@ -181,8 +256,9 @@ class Request(object_ref):
 
     def replace(self, *args: Any, **kwargs: Any) -> "Request":
         """Create a new Request with the same attributes except for those given new values"""
-        for x in self.attributes:
-            kwargs.setdefault(x, getattr(self, x))
+        for name in self.attributes:
+            if name not in kwargs:
+                kwargs[name] = getattr(self, name)
         cls = kwargs.pop("cls", self.__class__)
         return cast(Request, cls(*args, **kwargs))
 
@@ -220,6 +296,8 @@ class Request(object_ref):
         To translate a cURL command into a Scrapy request,
         you may use `curl2scrapy <https://michael-shub.github.io/curl2scrapy/>`_.
         """
+        from scrapy.utils.curl import curl_to_request_kwargs
+
         request_kwargs = curl_to_request_kwargs(curl_command, ignore_unknown_options)
         request_kwargs.update(kwargs)
         return cls(**request_kwargs)
@@ -240,19 +318,50 @@ class Request(object_ref):
             "errback": _find_method(spider, self.errback)
             if callable(self.errback)
             else self.errback,
-            "headers": dict(self.headers),
+            # dict.copy() rather than dict() or Headers.copy(): it returns a
+            # plain dict, cloned in C without going through the constructor
+            "headers": dict.copy(self.headers),
+            "method": self.method,
+            "body": self.body,
+            "cookies": self.cookies,
+            "meta": self.meta,
+            "encoding": self.encoding,
+            "priority": self.priority,
+            "dont_filter": self.dont_filter,
+            "flags": self.flags,
+            "cb_kwargs": self.cb_kwargs,
         }
-        for attr in self.attributes:
-            d.setdefault(attr, getattr(self, attr))
+        if self.attributes is not Request.attributes:
+            # attributes added by subclasses
+            for attr in self.attributes:
+                if attr not in d:
+                    d[attr] = getattr(self, attr)
         if type(self) is not Request:  # pylint: disable=unidiomatic-typecheck
             d["_class"] = self.__module__ + "." + self.__class__.__name__
         return d
 
 
+# Cached, as the same URLs tend to be seen many times during a crawl. The
+# cache keeps both the given and the normalized URL alive, so data: URLs and
+# URLs longer than _MAX_CACHED_URL_LENGTH, which can be arbitrarily large and
+# are seldom seen twice, bypass it.
+_MAX_CACHED_URL_LENGTH = 2083
+_cached_normalize_url = lru_cache(maxsize=4096)(_normalize_and_validate)
+
+
 def _find_method(obj: Any, func: Callable) -> str:
     """Helper function for Request.to_dict"""
     # Only instance methods contain ``__func__``
     if obj and hasattr(func, "__func__"):
+        # Fast path: look the method up in the class of obj, and make sure it
+        # has not been overridden in the instance.
+        name = _resolve_method_name(obj.__class__, func.__func__)
+        if name is not None:
+            obj_func = getattr(obj, name, None)
+            if getattr(obj_func, "__func__", None) is func.__func__:
+                return name
+        import inspect
+
         members = inspect.getmembers(obj, predicate=inspect.ismethod)
         for name, obj_func in members:
             # We need to use __func__ to access the original function object because instance
@@ -263,3 +372,18 @@ def _find_method(obj: Any, func: Callable) -> str:
             if obj_func.__func__ is func.__func__:
                 return name
     raise ValueError(f"Function {func} is not an instance method in: {obj}")
+
+
+@lru_cache(maxsize=256)
+def _resolve_method_name(cls: type, func: Callable) -> Optional[str]:
+    """Helper function for _find_method
+
+    Return the name of the attribute of *cls* that holds *func*, if any.
+    Results are cached, as the same callbacks are looked up once per
+    serialized request.
+    """
+    for name in dir(cls):
+        value = getattr(cls, name, None)
+        if getattr(value, "__func__", value) is func:
+            return name
+    return None
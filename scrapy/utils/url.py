@@ -5,8 +5,9 @@ library.
 Some of the functions that used to be imported from this module have been moved
 to the w3lib.url module. Always import those from there instead.
 """
+import codecs
 import re
-from typing import TYPE_CHECKING, Iterable, Optional, Type, Union, cast
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple, Type, Union, cast
 from urllib.parse import ParseResult, urldefrag, urlparse, urlunparse
 
 # scrapy.utils.url was moved to w3lib.url and import * ensures this
@@ -76,13 +77,60 @@ def escape_ajax(url: str) -> str:
     'www.example.com/ajax.html#'
     >>> escape_ajax("www.example.com/ajax.html")
     'www.example.com/ajax.html'
+    >>> escape_ajax("www.example.com/ajax.html#key=value#!other")
+    'www.example.com/ajax.html#key=value#!other'
     """
+    # Cheap pre-check: URLs without "#!" can not be "AJAX crawlable", so there
+    # is no need to split off the fragment.
+    if "#!" not in url:
+        return url
     defrag, frag = urldefrag(url)
     if not frag.startswith("!"):
         return url
     return add_or_replace_parameter(defrag, "_escaped_fragment_", frag[1:])
 
 
+# URLs that safe_url_string() returns unchanged: lowercase scheme and host,
+# optional port and only characters that never need percent-encoding. Empty
+# queries and fragments are excluded, as they are dropped.
+_SAFE_URL_RE = re.compile(
+    r"""
+    [a-z][a-z0-9+.-]*://[a-z0-9._~-]+(?::[1-9][0-9]{0,3})?  # scheme, host, port
+    (?:
+        /[A-Za-z0-9._~!$&()*+,;=:@/%-]*  # path
+        (?:\?[A-Za-z0-9._~!$&()*+,;=:@/?%-]+)?  # query
+        (?:\#[A-Za-z0-9._~!$&()*+,;=:@/?%-]+)?  # fragment
+    )?
+    """,
+    re.VERBOSE,
+)
+
+
+def _normalize_and_validate(url: str, encoding: str) -> Tuple[str, bool]:
+    """Return the safe, AJAX-escaped version of *url* and whether it has a
+    scheme (or is an ``about:`` or ``data:`` URL).
+
+    >>> _normalize_and_validate("http://www.example.com/a b#!k=v", "utf-8")
+    ('http://www.example.com/a%20b?_escaped_fragment_=k%3Dv', True)
+    >>> _normalize_and_validate("www.example.com/a", "utf-8")
+    ('www.example.com/a', False)
+    """
+    if (
+        type(url) is str  # pylint: disable=unidiomatic-typecheck
+        and url.isascii()
+        and _SAFE_URL_RE.fullmatch(url)
+    ):
+        # safe_url_string() would return the URL unchanged, but it would
+        # still reject an invalid encoding
+        codecs.lookup(encoding)
+        # The pattern already requires a scheme, and escape_ajax() only
+        # rewrites what follows the "#", so there is nothing left to check.
+        return escape_ajax(url), True
+    safe_url = escape_ajax(safe_url_string(url, encoding))
+    has_scheme = "://" in safe_url or safe_url.startswith(("about:", "data:"))
+    return safe_url, has_scheme
+
+
 def add_http_if_no_scheme(url: str) -> str:
     """Add http as the default scheme if it is missing from the url."""
     match = re.match(r"^\w+://", url, flags=re.I)
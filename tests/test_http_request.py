@@ -1,8 +1,11 @@
+import copy
 import json
+import pickle
 import re
 import unittest
 import warnings
 import xmlrpc.client
+from collections import OrderedDict, defaultdict
 from unittest import mock
 from urllib.parse import parse_qs, unquote_to_bytes, urlparse
 
@@ -14,7 +17,7 @@ from scrapy.http import (
     Request,
     XmlRpcRequest,
 )
-from scrapy.http.request import NO_CALLBACK
+from scrapy.http.request import NO_CALLBACK, _cached_normalize_url
 from scrapy.utils.python import to_bytes, to_unicode
 
 
@@ -52,6 +55,43 @@ class RequestTest(unittest.TestCase):
         assert r.headers is not headers
         self.assertEqual(r.headers[b"caca"], b"coco")
 
+    def test_lazy_attributes(self):
+        r = self.request_class("http://www.example.com")
+        meta = r.meta
+        meta["foo"] = "bar"
+        self.assertIs(r.meta, meta)
+        cb_kwargs = r.cb_kwargs
+        cb_kwargs["key"] = "value"
+        self.assertIs(r.cb_kwargs, cb_kwargs)
+        cookies = r.cookies
+        cookies["currency"] = "usd"
+        self.assertIs(r.cookies, cookies)
+        r.flags.append("cached")
+        self.assertEqual(r.flags, ["cached"])
+
+    def test_lazy_attributes_copy(self):
+        r1 = self.request_class("http://www.example.com")
+        for r2 in (copy.copy(r1), pickle.loads(pickle.dumps(r1))):
+            for name in ("cookies", "meta", "cb_kwargs", "flags"):
+                self.assertIsNot(getattr(r2, name), getattr(r1, name))
+
+    def test_container_types(self):
+        meta = defaultdict(list, {"a": 1})
+        cb_kwargs = OrderedDict(key="value")
+        r = self.request_class(
+            "http://www.example.com",
+            meta=meta,
+            cb_kwargs=cb_kwargs,
+            flags=("cached",),
+        )
+        self.assertIs(type(r.meta), dict)
+        self.assertEqual(r.meta, {"a": 1})
+        self.assertIs(type(r.cb_kwargs), dict)
+        self.assertEqual(r.cb_kwargs, {"key": "value"})
+        self.assertEqual(r.flags, ["cached"])
+        r.flags.append("other")
+        self.assertEqual(r.flags, ["cached", "other"])
+
     def test_url_scheme(self):
         # This test passes by not raising any (ValueError) exception
         self.request_class("http://example.org")
@@ -106,6 +146,42 @@ class RequestTest(unittest.TestCase):
         r = self.request_class(url="http://www.scrapy.org/blank space")
         self.assertEqual(r.url, "http://www.scrapy.org/blank%20space")
 
+    def test_url_cache_large_urls(self):
+        before = _cached_normalize_url.cache_info()
+        self.request_class(url="data:text/plain;base64," + "QQ==" * 1000)
+        self.request_class(url="http://www.scrapy.org/" + "a" * 3000)
+        after = _cached_normalize_url.cache_info()
+        self.assertEqual(after.hits, before.hits)
+        self.assertEqual(after.misses, before.misses)
+
+    def test_url_normalization(self):
+        for url, expected in (
+            (
+                "http://www.scrapy.org/a/b?c=d&e=f#g",
+                "http://www.scrapy.org/a/b?c=d&e=f#g",
+            ),
+            ("http://localhost:8080/a%20b", "http://localhost:8080/a%20b"),
+            ("HTTP://www.Scrapy.org/a", "http://www.scrapy.org/a"),
+            ("http://www.scrapy.org/a?", "http://www.scrapy.org/a"),
+            ("http://www.scrapy.org/a#", "http://www.scrapy.org/a"),
+            ("http://www.scrapy.org/a|b", "http://www.scrapy.org/a%7Cb"),
+        ):
+            r = self.request_class(url=url)
+            self.assertEqual(r.url, expected)
+
+    def test_url_str_subclass(self):
+        class CustomStr(str):
+            pass
+
+        url = "http://www.scrapy.org/str/subclass"
+        r = self.request_class(url=CustomStr(url))
+        self.assertIs(type(r.url), str)
+        self.assertIs(type(self.request_class(url=url).url), str)
+
+    def test_url_invalid_encoding(self):
+        with self.assertRaises(LookupError):
+            self.request_class(url="http://www.scrapy.org/a", encoding="bogus")
+
     def test_url_encoding(self):
         r = self.request_class(url="http://www.scrapy.org/price/£")
         self.assertEqual(r.url, "http://www.scrapy.org/price/%C2%A3")
@@ -254,6 +330,14 @@ class RequestTest(unittest.TestCase):
 
         assert isinstance(r2, CustomRequest)
 
+    def test_subclass_dict(self):
+        class CustomRequest(self.request_class):
+            pass
+
+        r = CustomRequest("http://www.example.com")
+        r.custom = "value"
+        self.assertEqual(r.custom, "value")
+
     def test_replace(self):
         """Test Request.replace() method"""
         r1 = self.request_class("http://www.example.com", method="GET")
@@ -277,10 +361,35 @@ class RequestTest(unittest.TestCase):
         self.assertEqual(r4.meta, {})
         assert r4.dont_filter is False
 
+    def test_replace_extended_attributes(self):
+        class CustomRequest(self.request_class):
+            attributes = self.request_class.attributes + ("custom",)
+
+            def __init__(self, *args, custom=None, **kwargs):
+                self.custom = custom
+                super().__init__(*args, **kwargs)
+
+        r = CustomRequest("http://www.example.com", custom="value")
+        self.assertEqual(r.replace().custom, "value")
+        self.assertEqual(r.replace(custom="other").custom, "other")
+
     def test_method_always_str(self):
         r = self.request_class("http://www.example.com", method="POST")
         assert isinstance(r.method, str)
 
+    def test_method_uppercase(self):
+        r = self.request_class("http://www.example.com", method="post")
+        self.assertEqual(r.method, "POST")
+        r = self.request_class("http://www.example.com", method="propfind")
+        self.assertEqual(r.method, "PROPFIND")
+
+        class Method(str):
+            pass
+
+        r = self.request_class("http://www.example.com", method=Method("GET"))
+        self.assertIs(type(r.method), str)
+        self.assertEqual(r.method, "GET")
+
     def test_immutable_attributes(self):
         r = self.request_class("http://example.com")
         self.assertRaises(AttributeError, setattr, r, "url", "http://example2.com")
@@ -330,6 +439,17 @@ class RequestTest(unittest.TestCase):
                 errback="a_function",
             )
 
+    def test_priority_type(self):
+        class Priority(int):
+            pass
+
+        r = self.request_class("http://example.com", priority=Priority(5))
+        self.assertEqual(r.priority, 5)
+        with self.assertRaises(TypeError):
+            self.request_class("http://example.com", priority="5")
+        with self.assertRaises(TypeError):
+            self.request_class("http://example.com", priority=5.0)
+
     def test_no_callback(self):
         with self.assertRaises(RuntimeError):
             NO_CALLBACK()
@@ -422,6 +542,13 @@ class RequestTest(unittest.TestCase):
         )
 
 
+class RequestSlotsTest(unittest.TestCase):
+    def test_slots(self):
+        r = Request("http://www.example.com")
+        self.assertFalse(hasattr(r, "__dict__"))
+        self.assertRaises(AttributeError, setattr, r, "custom", "value")
+
+
 class FormRequestTest(RequestTest):
     request_class = FormRequest
 
@@ -34,6 +34,21 @@ class RequestSerializationTest(unittest.TestCase):
         )
         self._assert_serializes_ok(r, spider=self.spider)
 
+    def test_overridden_property(self):
+        class FragmentRequest(Request):
+            @property
+            def url(self):
+                return self._url + "#custom"
+
+        r = FragmentRequest("http://www.example.com/")
+        self.assertEqual(r.to_dict()["url"], "http://www.example.com/#custom")
+
+    def test_headers_plain_dict(self):
+        r = Request("http://www.example.com", headers={"Accept": "text/html"})
+        d = r.to_dict()
+        self.assertIs(type(d["headers"]), dict)
+        self.assertEqual(d["headers"], {b"Accept": [b"text/html"]})
+
     def test_latin1_body(self):
         r = Request("http://www.example.com", body=b"\xa3")
         self._assert_serializes_ok(r)